@@ -20,8 +20,14 @@ Exports:
         save_file_combined, save_memory_combined, save_file_separate, 
         save_memory_separate
     - webui: duosubs_gr_blocks
+
+The pipeline, Merger and web UI exports are imported on first access, so importing 
+the package does not load sentence-transformers or gradio up front.
 """
 
+import typing as _typing
+from importlib import import_module as _import_module
+
 from duosubs.common.enums import (
                                   DeviceType,
                                   MergingMode,
@@ -36,14 +42,6 @@ from duosubs.common.exceptions import (
                                   SaveSubsError,
 )
 from duosubs.common.types import MergeArgs
-from duosubs.core.merge_pipeline import (
-                                  load_sentence_transformer_model,
-                                  load_subtitles,
-                                  merge_subtitles,
-                                  run_merge_pipeline,
-                                  save_subtitles_in_zip,
-)
-from duosubs.core.merger import Merger
 from duosubs.io.loader import load_file_edit, load_subs
 from duosubs.io.writer import (
                                   save_file_combined,
@@ -55,7 +53,34 @@ from duosubs.io.writer import (
 )
 from duosubs.subtitle.data import SubtitleData
 from duosubs.subtitle.field import SubtitleField
-from duosubs.webui.ui.layout import create_main_gr_blocks_ui as create_duosubs_gr_blocks
+
+if _typing.TYPE_CHECKING:
+    from duosubs.core.merge_pipeline import (
+                                  load_sentence_transformer_model,
+                                  load_subtitles,
+                                  merge_subtitles,
+                                  run_merge_pipeline,
+                                  save_subtitles_in_zip,
+    )
+    from duosubs.core.merger import Merger
+    from duosubs.webui.ui.layout import (
+                                  create_main_gr_blocks_ui as create_duosubs_gr_blocks,
+    )
+
+# Exports backed by sentence-transformers or gradio, imported on first access
+_LAZY_EXPORTS: dict[str, tuple[str, str]] = {
+    "load_sentence_transformer_model": (
+        "duosubs.core.merge_pipeline", "load_sentence_transformer_model"
+    ),
+    "load_subtitles": ("duosubs.core.merge_pipeline", "load_subtitles"),
+    "merge_subtitles": ("duosubs.core.merge_pipeline", "merge_subtitles"),
+    "run_merge_pipeline": ("duosubs.core.merge_pipeline", "run_merge_pipeline"),
+    "save_subtitles_in_zip": ("duosubs.core.merge_pipeline", "save_subtitles_in_zip"),
+    "Merger": ("duosubs.core.merger", "Merger"),
+    "create_duosubs_gr_blocks": (
+        "duosubs.webui.ui.layout", "create_main_gr_blocks_ui"
+    ),
+}
 
 __version__ = "1.2.0"
 
@@ -101,3 +126,32 @@ LoadModelError.__module__ = "duosubs"
 LoadSubsError.__module__ = "duosubs"
 MergeSubsError.__module__ = "duosubs"
 SaveSubsError.__module__ = "duosubs"
+
+def __getattr__(name: str) -> _typing.Any:
+    """
+    Import a lazy export on first access and cache it in the module namespace.
+
+    Args:
+        name (str): Name of the attribute being accessed.
+
+    Returns:
+        Any: The requested export.
+
+    Raises:
+        AttributeError: If the name is not a lazy export of the package.
+    """
+    if name in _LAZY_EXPORTS:
+        module_name, attr_name = _LAZY_EXPORTS[name]
+        value = getattr(_import_module(module_name), attr_name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__() -> list[str]:
+    """
+    List the package attributes, including lazy exports that are not imported yet.
+
+    Returns:
+        list[str]: Sorted attribute names of the package.
+    """
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
@@ -8,8 +8,10 @@ clear option handling.
 """
 
 from enum import Enum
+from typing import TYPE_CHECKING
 
-import torch
+if TYPE_CHECKING:
+    import torch
 
 
 class SubtitleFormat(str, Enum):
@@ -91,13 +93,15 @@ class ModelPrecision(str, Enum):
     FLOAT16 = "float16"
     BFLOAT16 = "bfloat16"
 
-    def to_torch_dtype(self) -> torch.dtype:
+    def to_torch_dtype(self) -> "torch.dtype":
         """
         Converts the precision enum value to a corresponding PyTorch dtype.
 
         Returns:
             torch.dtype: Corresponding PyTorch dtype for the precision.
         """
+        import torch
+
         return {
             "float32": torch.float,
             "float16": torch.float16,
@@ -8,18 +8,21 @@ saving routines.
 """
 
 import warnings
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Optional, Sequence, Union
 
 from .enums import DeviceType, MergingMode, ModelPrecision, OmitFile, SubtitleFormat
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, kw_only=True)
 class MergeArgs:
     """
     Container for all arguments used in the subtitle merging workflow.
 
+    All fields are keyword-only. Instances are immutable; use ``dataclasses.replace`` 
+    to derive a modified copy.
+
     Attributes:
         primary (Path | str): Path to the primary language subtitle file. Defaults to 
             "" (empty Path).
@@ -46,8 +49,8 @@ class MergeArgs:
             to True.
         secondary_above (bool): Whether to show secondary subtitle above primary. 
             Defaults to True.
-        omit (List[OmitFile]): List of file types to omit from output. Defults to 
-            List[OmitFile.EDIT]
+        omit (Sequence[OmitFile]): File types to omit from output. Defaults to 
+            (OmitFile.EDIT,)
         format_all (Optional[SubtitleFormat]): File format for all subtitle outputs. 
             Defaults to None.
         format_combined (Optional[SubtitleFormat]): File format for combined subtitle 
@@ -81,7 +84,7 @@ class MergeArgs:
     merging_mode: MergingMode = MergingMode.SYNCED
     retain_newline: bool = False
     secondary_above: bool = False
-    omit: List[OmitFile] = field(default_factory=lambda: [OmitFile.EDIT])
+    omit: Sequence[OmitFile] = (OmitFile.EDIT,)
     format_all: Optional[SubtitleFormat] = None
     format_combined: Optional[SubtitleFormat] = None
     format_primary: Optional[SubtitleFormat] = None
@@ -101,7 +104,9 @@ class MergeArgs:
                 DeprecationWarning,
                 stacklevel=2,
             )
-            if self.ignore_non_overlap_filter:
-                self.merging_mode = MergingMode.MIXED
-            else:
-                self.merging_mode = MergingMode.SYNCED
+            object.__setattr__(
+                self,
+                "merging_mode",
+                MergingMode.MIXED if self.ignore_non_overlap_filter
+                else MergingMode.SYNCED
+            )
@@ -7,7 +7,7 @@ scripts.
 """
 import platform
 from pathlib import Path
-from typing import Any, Callable, Optional, Union
+from typing import Any, Callable, Optional, Sequence, Union
 from zipfile import ZIP_DEFLATED, ZipFile
 
 import pysubs2
@@ -368,12 +368,12 @@ def _save_file(
             file_name = output_name + ".json.gz"
             zipf.writestr(file_name, compressed_bytes)
 
-def _retain_files(omit_list: list[OmitFile]) -> list[bool]:
+def _retain_files(omit_list: Sequence[OmitFile]) -> list[bool]:
     """
     Determine which output files to retain based on the omit list.
 
     Args:
-        omit_list (list[OmitFile]): List of file types to omit from output.
+        omit_list (Sequence[OmitFile]): File types to omit from output.
 
     Returns:
         list[bool]: List of booleans indicating which files to retain.
@@ -8,13 +8,14 @@ information. It supports both plain and compressed formats.
 Dependencies:
     - pysubs2: For subtitle file parsing and style handling.
     - charset_normalizer: For robust encoding detection.
+    - orjson: For fast JSON parsing of edit files.
 """
 
 import gzip
-import json
 from pathlib import Path
 from typing import Union
 
+import orjson
 import pysubs2
 from charset_normalizer import from_path
 
@@ -91,8 +92,8 @@ def load_file_edit(
         - SSAFile object containing primary styles.
         - SSAFile object containing secondary styles.
     """
-    with gzip.open(file_path, "rt", encoding="utf-8") as file:
-        data = _decode(json.load(file))
+    with gzip.open(file_path, "rb") as file:
+        data = _decode(orjson.loads(file.read()))
 
     ssa1_styles = _deserialize_styles(data["primary_styles"])
     ssa2_styles = _deserialize_styles(data["secondary_styles"])
@@ -22,6 +22,15 @@ from duosubs.common.constants import (
 )
 from duosubs.subtitle.field import SubtitleField
 
+# SSAStyle attributes holding pysubs2.Color values
+_STYLE_COLOR_FIELDS: tuple[str, ...] = (
+    "primarycolor",
+    "secondarycolor",
+    "tertiarycolor",
+    "outlinecolor",
+    "backcolor",
+)
+
 
 def _encode(obj: Any) -> Any:
     """
@@ -80,9 +89,8 @@ def _serialize_styles(styles: Dict[str, pysubs2.SSAStyle]) -> Dict[str, dict[str
 
     def clean(style: pysubs2.SSAStyle) -> dict[str, Any]:
         d = style.__dict__.copy()
-        for k, v in d.items():
-            if isinstance(v, pysubs2.Color):
-                d[k] = color_to_int(v)
+        for k in _STYLE_COLOR_FIELDS:
+            d[k] = color_to_int(d[k])
         return d
 
     return {name: clean(style) for name, style in styles.items()}
@@ -109,15 +117,15 @@ def _deserialize_styles(
 
     def restore(style_data: dict[str, Any]) -> pysubs2.SSAStyle:
         d = style_data.copy()
-        for k, v in d.items():
-            kl = k.lower()
-            if isinstance(v, int) and kl.endswith("color"):
+        for k in _STYLE_COLOR_FIELDS:
+            v = d.get(k)
+            if isinstance(v, int):
                 d[k] = int_to_color(v)
-            elif kl == "alignment":
-                try:
-                    d[k] = pysubs2.Alignment(v)
-                except ValueError:
-                    pass
+        if "alignment" in d:
+            try:
+                d["alignment"] = pysubs2.Alignment(d["alignment"])
+            except ValueError:
+                pass
         return pysubs2.SSAStyle(**d)
 
     return {name: restore(style_data) for name, style_data in style_dict.items()}
@@ -201,11 +209,9 @@ def _rename_common_styles(
         - Updated secondary styles with renamed common styles.
         - Mapping of old style names to new names in secondary styles.
     """
-    style_primary_name: set[str] = {name for name, _ in primary_styles.styles.items()}
-    style_secondary_name: set[str] = {
-        name for name, _ in secondary_styles.styles.items()
-    }
-    common_name: set[str] = style_primary_name & style_secondary_name
+    common_name: set[str] = (
+        primary_styles.styles.keys() & secondary_styles.styles.keys()
+    )
 
     replacement_dict: Dict[str, str] = {}
     for name in common_name:
@@ -10,16 +10,17 @@ native subtitle formats.
 
 Dependencies:
     - pysubs2: For subtitle file and style handling.
-    - gzip, io, json: For file I/O and serialization.
+    - gzip, io: For file I/O and compression.
+    - orjson: For fast JSON serialization.
 """
 
 import gzip
 import io
-import json
 from dataclasses import asdict
 from pathlib import Path
 from typing import Any, Union
 
+import orjson
 import pysubs2
 
 from duosubs.subtitle.field import SubtitleField
@@ -57,12 +58,8 @@ def save_file_edit(
     )
     save_path = Path(save_path)
     gz_path = save_path.with_suffix(save_path.suffix + ".gz")
-    with gzip.open(gz_path, "wt", encoding="utf-8") as file:
-        json.dump(
-            _encode(data_to_save),
-            file,
-            separators=(",", ":")
-        )
+    with gzip.open(gz_path, "wb") as file:
+        file.write(orjson.dumps(_encode(data_to_save)))
 
 def save_memory_edit(
         sub_list: list[SubtitleField],
@@ -88,11 +85,7 @@ def save_memory_edit(
 
     buffer = io.BytesIO()
     with gzip.GzipFile(fileobj=buffer, mode="w") as gz:
-        json_bytes = json.dumps(
-            _encode(data_to_save),
-            separators=(",", ":")
-        ).encode("utf-8")
-        gz.write(json_bytes)
+        gz.write(orjson.dumps(_encode(data_to_save)))
 
     return buffer.getvalue()
 
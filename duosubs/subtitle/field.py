@@ -10,7 +10,7 @@ alignment score.
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class SubtitleField:
     """
     Represents a single subtitle event with timing, text, style, and alignment score.
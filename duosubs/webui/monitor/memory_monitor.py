@@ -6,7 +6,7 @@ This module monitors system RAM and GPU VRAM usage, providing a live status tabl
 """
 
 import time
-from typing import Iterator
+from typing import Any, Iterator
 
 import pandas as pd
 import psutil
@@ -24,6 +24,7 @@ class LiveMemoryMonitor:
         _instance: Singleton instance.
         _has_cuda: Whether CUDA GPUs are available.
         _gpu_count: Number of detected GPUs.
+        _gpu_devices: Cached NVML handle and name for each GPU index.
     """
     _instance = None
 
@@ -46,6 +47,7 @@ class LiveMemoryMonitor:
             self._initialized = True
             self._has_cuda = torch.cuda.is_available()
             self._gpu_count = 0
+            self._gpu_devices: dict[int, tuple[Any, str]] = {}
 
             if self._has_cuda:
                 try:
@@ -90,8 +92,7 @@ class LiveMemoryMonitor:
         if self._has_cuda:
             for i in range(self._gpu_count):
                 try:
-                    handle = pynvml.nvmlDeviceGetHandleByIndex(i)
-                    name = pynvml.nvmlDeviceGetName(handle)
+                    handle, name = self._get_gpu_device(i)
                     mem_info = pynvml.nvmlDeviceGetMemoryInfo(handle)
                     vram_percent = mem_info.used / mem_info.total * 100
 
@@ -106,3 +107,18 @@ class LiveMemoryMonitor:
                     print(str(e))
 
         return pd.DataFrame(rows, columns=["Name", "Usage", "Used", "Total"])
+
+    def _get_gpu_device(self, index: int) -> tuple[Any, str]:
+        """
+        Returns the NVML handle and name of a GPU, querying NVML only on first use.
+
+        Args:
+            index (int): GPU index.
+
+        Returns:
+            tuple[Any, str]: NVML device handle and GPU name.
+        """
+        if index not in self._gpu_devices:
+            handle = pynvml.nvmlDeviceGetHandleByIndex(index)
+            self._gpu_devices[index] = (handle, pynvml.nvmlDeviceGetName(handle))
+        return self._gpu_devices[index]
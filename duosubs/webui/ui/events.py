@@ -103,6 +103,14 @@ def start_merging(
     if progress is None:
         progress = gr.Progress()
 
+    omit = [OmitFile.EDIT]
+    if "Combined" in omit_subtitles:
+        omit.append(OmitFile.COMBINED)
+    if "Primary" in omit_subtitles:
+        omit.append(OmitFile.PRIMARY)
+    if "Secondary" in omit_subtitles:
+        omit.append(OmitFile.SECONDARY)
+
     args = MergeArgs(
         primary=primary_subtitles,
         secondary=secondary_subtitles,
@@ -111,18 +119,11 @@ def start_merging(
         merging_mode=MergingMode(merging_mode.lower()),
         retain_newline=retain_newline,
         secondary_above=secondary_above_primary,
-        omit=[OmitFile.EDIT],
+        omit=omit,
         format_combined=SubtitleFormat(combined_format),
         format_primary=SubtitleFormat(primary_format),
         format_secondary=SubtitleFormat(secondary_format)
     )
-
-    if "Combined" in omit_subtitles:
-        args.omit.append(OmitFile.COMBINED)
-    if "Primary" in omit_subtitles:
-        args.omit.append(OmitFile.PRIMARY)
-    if "Secondary" in omit_subtitles:
-        args.omit.append(OmitFile.SECONDARY)
     
     zip_name_with_path: str | None = None
 
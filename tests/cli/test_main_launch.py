@@ -6,9 +6,11 @@ merging tool.
 Tests invalid CLI options, server startup, and helper utilities.
 """
 
-import multiprocessing
-import random
+import subprocess
+import sys
+from pathlib import Path
 
+import pytest
 from typer.testing import CliRunner
 
 from duosubs.cli.main import app
@@ -21,43 +23,67 @@ runner = CliRunner()
 # Invalid Option Tests
 # ----------------------------
 
-def test_invalid_lower_port_number() -> None:
+@pytest.mark.parametrize("port", [-1, 0, 1023])
+def test_invalid_lower_port_number(port: int) -> None:
     """
     Test that providing a port number below the valid range fails.
+
+    Args:
+        port (int): Port number below the valid range.
     """
-    lower_random_port = random.randint(-65535, 1023)
-    result = runner.invoke(app, ["launch-webui", "--port", str(lower_random_port)])
+    result = runner.invoke(
+        app,
+        ["launch-webui", "--port", str(port)],
+        catch_exceptions=False
+    )
     assert result.exit_code != 0
     assert "Invalid value for '--port'" in strip_ansi(result.output)
 
-def test_invalid_higher_port_number() -> None:
+@pytest.mark.parametrize("port", [65536, 99999])
+def test_invalid_higher_port_number(port: int) -> None:
     """
     Test that providing a port number above the valid range fails.
+
+    Args:
+        port (int): Port number above the valid range.
     """
-    upper_random_port = random.randint(65536, 100000)
-    result = runner.invoke(app, ["launch-webui", "--port", str(upper_random_port)])
+    result = runner.invoke(
+        app,
+        ["launch-webui", "--port", str(port)],
+        catch_exceptions=False
+    )
     assert result.exit_code != 0
     assert "Invalid value for '--port'" in strip_ansi(result.output)
 
-def test_invalid_cache_delete_frequency() -> None:
+@pytest.mark.parametrize("frequency", [-1, 0])
+def test_invalid_cache_delete_frequency(frequency: int) -> None:
     """
-    Test that providing a negative cache delete frequency fails.
+    Test that providing a non-positive cache delete frequency fails.
+
+    Args:
+        frequency (int): Non-positive cache delete frequency.
     """
-    random_frequency = random.randint(-10000, 0)
-    result = runner.invoke(app, [
-        "launch-webui", 
-        "--cache-delete-freq", str(random_frequency)
-        ]
+    result = runner.invoke(
+        app,
+        ["launch-webui", "--cache-delete-freq", str(frequency)],
+        catch_exceptions=False
     )
     assert result.exit_code != 0
     assert "Invalid value for '--cache-delete-freq'" in strip_ansi(result.output)
 
-def test_invalid_cache_delete_age() -> None:
+@pytest.mark.parametrize("age", [-1, 0])
+def test_invalid_cache_delete_age(age: int) -> None:
     """
-    Test that providing a negative cache delete age fails.
+    Test that providing a non-positive cache delete age fails.
+
+    Args:
+        age (int): Non-positive cache delete age.
     """
-    random_age = random.randint(-10000, 0)
-    result = runner.invoke(app, ["launch-webui", "--cache-delete-age", str(random_age)])
+    result = runner.invoke(
+        app,
+        ["launch-webui", "--cache-delete-age", str(age)],
+        catch_exceptions=False
+    )
     assert result.exit_code != 0
     assert "Invalid value for '--cache-delete-age'" in strip_ansi(result.output)
 
@@ -65,25 +91,38 @@ def test_invalid_cache_delete_age() -> None:
 # Launching Server Tests
 # ----------------------------
 
-def test_server_launch() -> None:
+def test_server_launch(tmp_path: Path) -> None:
     """
     Test that the server launches and responds on a free port.
+
+    The server runs in a fresh interpreter rather than a fork of the pytest process, 
+    so the test session's imported modules are not duplicated. Its stderr is captured 
+    to a file and reported if the server does not become ready.
+
+    Args:
+        tmp_path (Path): Temporary directory for the server's stderr log.
     """
     port = get_free_port()
-    proc = multiprocessing.Process(target=run_gradio_web_ui, args=(port,), daemon=True)
-    proc.start()
+    stderr_path = tmp_path / "server_stderr.log"
+    with stderr_path.open("wb") as stderr_file:
+        proc = subprocess.Popen(
+            [
+                sys.executable, "-m", "duosubs.cli.main",
+                "launch-webui", "--port", str(port), "--no-inbrowser",
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=stderr_file,
+        )
     try:
-        assert wait_for_server(f"http://127.0.0.1:{port}/", timeout=30)
+        try:
+            wait_for_server(f"http://127.0.0.1:{port}/", timeout=30)
+        except RuntimeError as e:
+            stderr = stderr_path.read_text(encoding="utf-8", errors="replace")
+            pytest.fail(f"{e}\nServer stderr:\n{stderr}")
     finally:
         proc.terminate()
-        proc.join()
-
-# ----------------------------
-# Helper functions
-# ----------------------------
-
-def run_gradio_web_ui(port: int) -> None:
-    """
-    Run the Gradio web UI app on the specified port.
-    """
-    app(args=["launch-webui", "--port", str(port), "--no-inbrowser",])
+        try:
+            proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
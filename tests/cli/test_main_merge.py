@@ -18,6 +18,13 @@ from tests.common_utils.utils import strip_ansi
 # Test subtitle paths
 SUB_PATH = Path(__file__).parent / "data"
 
+# Shared arguments for merging the primary and secondary test subtitles
+MERGE_ARGS = (
+    "merge",
+    "--primary", str(SUB_PATH / "primary.srt"),
+    "--secondary", str(SUB_PATH / "secondary.srt"),
+)
+
 runner = CliRunner()
 
 # ------------------------
@@ -28,7 +35,7 @@ def test_missing_required_arguments() -> None:
     """
     Test that missing required CLI arguments returns an error.
     """
-    result = runner.invoke(app, ["merge"])
+    result = runner.invoke(app, ["merge"], catch_exceptions=False)
     assert result.exit_code != 0
     assert "Missing option '--primary'" in strip_ansi(result.output)
 
@@ -44,7 +51,7 @@ def test_nonexistent_primary_file() -> None:
         "merge",
         "--primary", "nonexistent.srt",
         "--secondary", str(SUB_PATH / "secondary.srt")
-    ])
+    ], catch_exceptions=False)
     assert result.exit_code == 1
     assert "Error in loading subtitles" in strip_ansi(result.output)
 
@@ -56,7 +63,7 @@ def test_invalid_primary_file_format() -> None:
         "merge",
         "--primary", str(SUB_PATH / "primary.txt"),
         "--secondary", str(SUB_PATH / "secondary.srt")
-    ])
+    ], catch_exceptions=False)
     assert result.exit_code == 1
     assert "Error in loading subtitles" in strip_ansi(result.output)
 
@@ -69,7 +76,7 @@ def test_empty_primary_file() -> None:
         "merge",
         "--primary", primary_subs,
         "--secondary", str(SUB_PATH / "secondary.srt")
-    ])
+    ], catch_exceptions=False)
     assert result.exit_code == 1
     assert (
         f"Primary subtitle file '{primary_subs}' is empty." 
@@ -91,11 +98,7 @@ def test_invalid_model(monkeypatch: pytest.MonkeyPatch) -> None:
         "duosubs.core.merge_pipeline.load_sentence_transformer_model", mock_load_model
     )
 
-    result = runner.invoke(app, [
-        "merge",
-        "--primary", str(SUB_PATH / "primary.srt"),
-        "--secondary", str(SUB_PATH / "secondary.srt")
-    ])
+    result = runner.invoke(app, [*MERGE_ARGS], catch_exceptions=False)
     assert result.exit_code == 2
     assert "Model not found" in strip_ansi(result.output)
 
@@ -108,11 +111,9 @@ def test_invalid_device() -> None:
     Test error for invalid device argument value.
     """
     result = runner.invoke(app, [
-        "merge",
-        "--primary", str(SUB_PATH / "primary.srt"),
-        "--secondary", str(SUB_PATH / "secondary.srt"),
+        *MERGE_ARGS,
         "--device", "amd"
-    ])
+    ], catch_exceptions=False)
     assert result.exit_code != 0
     assert "Invalid value for '--device'" in strip_ansi(result.output)
 
@@ -121,11 +122,9 @@ def test_invalid_batch_size() -> None:
     Test error for batch size below minimum allowed value.
     """
     result = runner.invoke(app, [
-        "merge",
-        "--primary", str(SUB_PATH / "primary.srt"),
-        "--secondary", str(SUB_PATH / "secondary.srt"),
+        *MERGE_ARGS,
         "--batch-size", "-1"
-    ])
+    ], catch_exceptions=False)
     assert result.exit_code != 0
     assert "Invalid value for '--batch-size'" in strip_ansi(result.output)
 
@@ -134,11 +133,9 @@ def test_invalid_precision() -> None:
     Test error for invalid precision argument.
     """
     result = runner.invoke(app, [
-        "merge",
-        "--primary", str(SUB_PATH / "primary.srt"),
-        "--secondary", str(SUB_PATH / "secondary.srt"),
+        *MERGE_ARGS,
         "--model-precision", "float"
-    ])
+    ], catch_exceptions=False)
     assert result.exit_code != 0
     assert "Invalid value for '--model-precision'" in strip_ansi(result.output)
 
@@ -147,11 +144,9 @@ def test_invalid_mode() -> None:
     Test error for invalid merging mode argument.
     """
     result = runner.invoke(app, [
-        "merge",
-        "--primary", str(SUB_PATH / "primary.srt"),
-        "--secondary", str(SUB_PATH / "secondary.srt"),
+        *MERGE_ARGS,
         "--mode", "normal"
-    ])
+    ], catch_exceptions=False)
     assert result.exit_code != 0
     assert "Invalid value for '--mode'" in strip_ansi(result.output)
 
@@ -161,11 +156,9 @@ def test_invalid_omit() -> None:
     Test error for invalid omit file type argument.
     """
     result = runner.invoke(app, [
-        "merge",
-        "--primary", str(SUB_PATH / "primary.srt"),
-        "--secondary", str(SUB_PATH / "secondary.srt"),
+        *MERGE_ARGS,
         "--omit", "nothing"
-    ])
+    ], catch_exceptions=False)
     assert result.exit_code != 0
     assert "Invalid value for '--omit'" in strip_ansi(result.output)
 
@@ -183,11 +176,9 @@ def test_invalid_format(case: str) -> None:
         case (str): The CLI argument for subtitle format.
     """
     result = runner.invoke(app, [
-        "merge",
-        "--primary", str(SUB_PATH / "primary.srt"),
-        "--secondary", str(SUB_PATH / "secondary.srt"),
+        *MERGE_ARGS,
         case, "txt"
-    ])
+    ], catch_exceptions=False)
     assert result.exit_code != 0
     assert f"Invalid value for '{case}'" in strip_ansi(result.output)
 
@@ -199,7 +190,7 @@ def test_merge_help() -> None:
     """
     Test that the CLI help message is printed and contains key options.
     """
-    result = runner.invoke(app, ["merge","--help"])
+    result = runner.invoke(app, ["merge","--help"], catch_exceptions=False)
     assert result.exit_code == 0
     assert "--primary" in strip_ansi(result.output)
     assert "--secondary" in strip_ansi(result.output)
@@ -216,12 +207,10 @@ def test_successful_merge(tmp_path: Path) -> None:
         tmp_path (Path): Temporary directory for output files.
     """
     result = runner.invoke(app, [
-        "merge",
-        "--primary", str(SUB_PATH / "primary.srt"),
-        "--secondary", str(SUB_PATH / "secondary.srt"),
+        *MERGE_ARGS,
         "--output-dir", str(tmp_path),
         "--model", "sentence-transformers/all-MiniLM-L6-v2"
-    ])
+    ], catch_exceptions=False)
 
     assert result.exit_code == 0
     assert any(p.suffix == ".zip" for p in tmp_path.iterdir())
@@ -239,13 +228,11 @@ def test_successful_merge_with_merging_mode(mode: str, tmp_path: Path) -> None:
         tmp_path (Path): Temporary directory for output files.
     """
     result = runner.invoke(app, [
-        "merge",
-        "--primary", str(SUB_PATH / "primary.srt"),
-        "--secondary", str(SUB_PATH / "secondary.srt"),
+        *MERGE_ARGS,
         "--output-dir", str(tmp_path),
         "--model", "sentence-transformers/all-MiniLM-L6-v2",
         "--mode", mode,
-    ])
+    ], catch_exceptions=False)
 
     assert result.exit_code == 0
     assert any(p.suffix == ".zip" for p in tmp_path.iterdir())
@@ -268,10 +255,6 @@ def test_stage_logger_output(monkeypatch: pytest.MonkeyPatch) -> None:
 
     monkeypatch.setattr("duosubs.cli.main.run_merge_pipeline", mock_run_pipeline)
 
-    result = runner.invoke(app, [
-        "merge",
-        "--primary", str(SUB_PATH / "primary.srt"),
-        "--secondary", str(SUB_PATH / "secondary.srt")
-    ])
+    result = runner.invoke(app, [*MERGE_ARGS], catch_exceptions=False)
     assert "Stage 1 log" in strip_ansi(result.output)
     assert "Stage 2 log" in strip_ansi(result.output)
@@ -4,15 +4,40 @@ Test utilities for loading YAML-based test cases and defining test data structur
 This module provides:
     - A helper function to load test cases from a YAML file for use in unit tests or 
         validation routines.
+    - A helper function to build SubtitleField objects from YAML subtitle entries.
     - TypedDict definitions for structured test data, such as subtitle fields.
+    - Shared test data paths and type aliases, such as the edit file data tuple.
 """
 
+import copy
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, TypedDict
 
+import pysubs2
 import yaml
 
+from duosubs.subtitle.field import SubtitleField
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader  # type: ignore[assignment]
+
+_sub_ansi_escape = re.compile(r"\x1B\[[0-?]*[ -/]*[@-~]", re.ASCII).sub
+
+# ----------------------------
+# Shared Test Data
+# ----------------------------
+
+SUB_COMPRESSED_DATA: Path = (
+    Path(__file__).parent.parent / "io" / "sub_data" / "TOS-en-cht.json.gz"
+)
+
+# Merged subtitles, primary styles and secondary styles, as returned by load_file_edit
+EditData = tuple[list[SubtitleField], pysubs2.SSAFile, pysubs2.SSAFile]
+
 # ----------------------------
 # Util Functions
 # ----------------------------
@@ -21,6 +46,9 @@ def load_test_cases(path: Path) -> Any:
     """
     Load test cases from a YAML file.
 
+    Each file is parsed only once per test session; every call returns a deep copy 
+    so that tests mutating their cases do not leak into other tests.
+
     Args:
         path (Path): Path to the YAML file containing test cases.
 
@@ -28,9 +56,35 @@ def load_test_cases(path: Path) -> Any:
         Any: Parsed test cases from the YAML file. The structure depends on the file 
             contents.
     """
+    return copy.deepcopy(_parse_yaml(path.resolve()))
+
+@lru_cache(maxsize=None)
+def _parse_yaml(path: Path) -> Any:
     with path.open(encoding="utf-8") as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=SafeLoader)
     
+def build_subtitle_fields(entries: list["SubtitleFieldDict"]) -> list[SubtitleField]:
+    """
+    Build fresh SubtitleField objects from subtitle entries loaded from YAML.
+
+    YAML has no tuple type, so token spans are converted from lists into the tuples 
+    SubtitleField expects. New objects are built on every call, as the merger mutates 
+    subtitles in place.
+
+    Args:
+        entries (list[SubtitleFieldDict]): Subtitle field entries from a test case.
+
+    Returns:
+        list[SubtitleField]: Subtitle fields with tuple token spans.
+    """
+    subs = [SubtitleField(**entry) for entry in entries]
+    for sub in subs:
+        primary_start, primary_end = sub.primary_token_spans
+        sub.primary_token_spans = (primary_start, primary_end)
+        secondary_start, secondary_end = sub.secondary_token_spans
+        sub.secondary_token_spans = (secondary_start, secondary_end)
+    return subs
+
 def strip_ansi(text: str) -> str:
     """
     Remove ANSI color and formatting codes, such as those used in terminal
@@ -42,7 +96,7 @@ def strip_ansi(text: str) -> str:
     Returns:
         str: The input string with ANSI codes removed.
     """
-    return re.sub(r"\x1B\[[0-?]*[ -/]*[@-~]", "", text)
+    return _sub_ansi_escape("", text)
 
 # ----------------------------
 # TypedDict Definitions for Tests
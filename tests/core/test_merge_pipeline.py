@@ -7,7 +7,7 @@ simulate dependencies and error conditions.
 """
 from pathlib import Path
 from typing import Any, NoReturn, TypedDict, cast
-from unittest.mock import MagicMock, Mock
+from unittest.mock import Mock
 from zipfile import ZipFile
 
 import pysubs2
@@ -52,22 +52,42 @@ class RetainFilesTests(TypedDict):
     input: list[str]
     expected: list[bool]
 
+# ----------------------------
+# Fixtures
+# ----------------------------
+
+@pytest.fixture(scope="module")
+def styles() -> pysubs2.SSAFile:
+    """
+    Pytest fixture providing a subtitle style table shared across the module.
+
+    None of the tests mutate it, so it is constructed only once.
+
+    Returns:
+        pysubs2.SSAFile: Style table with the default style renamed to "Primary_style".
+    """
+    shared_styles = pysubs2.SSAFile()
+    shared_styles.rename_style("Default", "Primary_style")
+    return shared_styles
+
 # ----------------------------
 # Load Subtitles Tests
 # ----------------------------
 
-def test_load_subtitles_success(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_load_subtitles_success(
+        monkeypatch: pytest.MonkeyPatch,
+        styles: pysubs2.SSAFile
+    ) -> None:
     """
     Test the load_subtitles function for successful loading of primary and secondary 
     subtitles.
 
     Args:
         monkeypatch (pytest.MonkeyPatch): Pytest fixture for monkeypatching functions.
+        styles (pysubs2.SSAFile): Shared subtitle style table.
     """
     args = MergeArgs(primary="tests/en.srt", secondary="tests/zh.srt")
     subs = [SubtitleField(start=1000, end=2000, primary_text="p1")]
-    styles = pysubs2.SSAFile()
-    styles.rename_style("Default", "Primary_style")
     tokens = ["toks"]
     styles_tokens = ["style_toks"]
 
@@ -106,16 +126,18 @@ def test_load_subtitles_failure(monkeypatch: pytest.MonkeyPatch) -> None:
     with pytest.raises(LoadSubsError):
         load_subtitles(args)
 
-def test_load_empty_subtitle(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_load_empty_subtitle(
+        monkeypatch: pytest.MonkeyPatch,
+        styles: pysubs2.SSAFile
+    ) -> None:
     """
     Test load_subtitles function for error handling when either subtitle file is empty.
 
     Args:
         monkeypatch (pytest.MonkeyPatch): Pytest fixture for monkeypatching functions.
+        styles (pysubs2.SSAFile): Shared subtitle style table.
     """
     args = MergeArgs(primary="tests/en.srt", secondary="tests/zh.srt")
-    styles = pysubs2.SSAFile()
-    styles.rename_style("Default", "Primary_style")
 
     sub_data = SubtitleData(
         subs=[],
@@ -180,32 +202,33 @@ def test_load_model_failure(monkeypatch: pytest.MonkeyPatch) -> None:
 # ----------------------------
 
 @pytest.mark.parametrize("success", [True, False])
-def test_merge_subtitles(monkeypatch: pytest.MonkeyPatch, success: bool) -> None:
+def test_merge_subtitles(
+        monkeypatch: pytest.MonkeyPatch,
+        styles: pysubs2.SSAFile,
+        success: bool
+    ) -> None:
     """
     Test merge_subtitle function, both successful and error cases.
 
     Args:
         monkeypatch (pytest.MonkeyPatch): Pytest fixture for monkeypatching functions.
+        styles (pysubs2.SSAFile): Shared subtitle style table.
         success (bool): Whether to simulate a successful or failing merge.
     """
-    fake_model = MagicMock()
+    fake_model: Any = object()
 
-    primary_styles = pysubs2.SSAFile()
-    primary_styles.rename_style("Default", "ENGLISH")
     primary_subs_data = SubtitleData(
         subs=[SubtitleField(start=0, end=1000, primary_text="Hi")],
-        styles=primary_styles,
+        styles=styles,
         tokens=["Hi"],
-        styles_tokens=["ENGLISH"]
+        styles_tokens=["Primary_style"]
     )
 
-    secondary_styles = pysubs2.SSAFile()
-    secondary_styles.rename_style("Default", "ENGLISH")
     secondary_subs_data = SubtitleData(
         subs=[SubtitleField(start=0, end=1000, secondary_text="Bonjour")],
-        styles=secondary_styles,
+        styles=styles,
         tokens=["Bonjour"],
-        styles_tokens=["FRENCH"]
+        styles_tokens=["Primary_style"]
     )
 
     args = MergeArgs(primary="a.srt", secondary="b.srt", model="LaBSE")
@@ -258,53 +281,63 @@ def test_merge_subtitles(monkeypatch: pytest.MonkeyPatch, success: bool) -> None
 # ----------------------------
 
 @pytest.mark.parametrize("success", [True, False])
-def test_save_subtitles_in_zip(monkeypatch: pytest.MonkeyPatch, success: bool) -> None:
+def test_save_subtitles_in_zip(
+        monkeypatch: pytest.MonkeyPatch,
+        tmp_path: Path,
+        styles: pysubs2.SSAFile,
+        success: bool
+    ) -> None:
     """
     Test save_subtitles_in_zip function, both successful and error cases.
 
     Args:
         monkeypatch (pytest.MonkeyPatch): Pytest fixture for monkeypatching functions.
+        tmp_path (Path): Temporary directory provided by pytest.
+        styles (pysubs2.SSAFile): Shared subtitle style table.
         success (bool): Whether to simulate a successful or failing save.
     """
     subs = [SubtitleField(start=0, end=1000, primary_text="Test")]
-    primary_styles = MagicMock()
-    secondary_styles = MagicMock()
 
     args = MergeArgs(
         primary="a.srt",
         secondary="b.srt",
         model="LaBSE",
-        format_all=SubtitleFormat.ASS
+        format_all=SubtitleFormat.ASS,
+        output_dir=tmp_path
     )
 
     monkeypatch.setattr(
         "duosubs.core.merge_pipeline._retain_files", 
         lambda omit: ["combined", "primary", "secondary"]
     )
-    monkeypatch.setattr(Path, "mkdir", lambda *a, **kw: None)
 
     if success:
         monkeypatch.setattr(
             "duosubs.core.merge_pipeline._save_file",
             lambda *a, **kw: None
         )
-        save_subtitles_in_zip(args, subs, primary_styles, secondary_styles)
+        save_subtitles_in_zip(args, subs, styles, styles)
     else:
         monkeypatch.setattr("duosubs.core.merge_pipeline._save_file", raise_error)
         with pytest.raises(SaveSubsError):
-            save_subtitles_in_zip(args, subs, primary_styles, secondary_styles)
+            save_subtitles_in_zip(args, subs, styles, styles)
 
 # ----------------------------
 # Utility Functions Tests
 # ----------------------------
 
-def test_save_file_outputs_zip(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+def test_save_file_outputs_zip(
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        styles: pysubs2.SSAFile
+    ) -> None:
     """
     Test that _save_file writes all expected files to the output zip archive.
 
     Args:
         tmp_path (Path): Temporary directory provided by pytest.
         monkeypatch (pytest.MonkeyPatch): Pytest fixture for monkeypatching functions.
+        styles (pysubs2.SSAFile): Shared subtitle style table.
     """
     output_name = "test_output"
     output_dir = tmp_path
@@ -326,8 +359,8 @@ def test_save_file_outputs_zip(tmp_path: Path, monkeypatch: pytest.MonkeyPatch)
 
     _save_file(
         subs=[SubtitleField(start=0, end=1000, primary_text="Test")],
-        primary_styles=MagicMock(),
-        secondary_styles=MagicMock(),
+        primary_styles=styles,
+        secondary_styles=styles,
         output_name=output_name,
         output_dir=output_dir,
         retained_file_tuple=retained,
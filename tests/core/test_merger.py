@@ -4,6 +4,7 @@ Unit tests for subtitle merging logic in duosubs.core.merger.Merger.
 This module contains pytest-based unit tests for the merging, alignment, and utility 
 functions of Merger, including helpers for score simulation and result comparison.
 """
+from itertools import chain
 from math import isclose
 from pathlib import Path
 from typing import Any, Callable, TypedDict, cast
@@ -17,7 +18,11 @@ from sentence_transformers import SentenceTransformer
 from duosubs.core.merger import Merger
 from duosubs.subtitle.data import SubtitleData
 from duosubs.subtitle.field import SubtitleField
-from tests.common_utils.utils import SubtitleFieldDict, load_test_cases
+from tests.common_utils.utils import (
+    SubtitleFieldDict,
+    build_subtitle_fields,
+    load_test_cases,
+)
 
 # pylint: disable=protected-access
 # Test cases paths
@@ -33,6 +38,9 @@ DATA_REMOVE_EXTENDED_SEGMENTS: Path =(
 )
 DATA_GET_PROGRESS_PERCENTAGE: Path =  DATA_PATH / "get_progress_percentage.yaml"
 
+# (left, right) score tensors returned in turn by the patched score function
+ScoreTensorPairs = list[tuple[torch.Tensor, torch.Tensor]]
+
 # ----------------------------
 # TypedDict Definitions for Tests
 # ----------------------------
@@ -176,6 +184,37 @@ class GetProgressPercentageTest(TypedDict):
     previous_ratio: list[int]
     expected: int
 
+# ----------------------------
+# Fixtures
+# ----------------------------
+
+@pytest.fixture(scope="module")
+def align_neighbour_score_pairs() -> dict[str, ScoreTensorPairs]:
+    """
+    Pytest fixture converting the score pairs of every align_subs_using_neighbours test 
+    case into tensors once for the whole module.
+
+    The tensors are only read by the merger, so they are shared across 
+    parametrizations.
+
+    Returns:
+        dict[str, ScoreTensorPairs]: Score tensors keyed by test case name.
+    """
+    cases = cast(
+        list[AlignSubsNeighbourTest],
+        load_test_cases(DATA_ALIGN_SUBS_NEIGHBOUR)
+    )
+    return {
+        case["name"]: [
+            (
+                torch.as_tensor(pair["left"], dtype=torch.float32),
+                torch.as_tensor(pair["right"], dtype=torch.float32)
+            )
+            for pair in case["scores"]
+        ]
+        for case in cases
+    }
+
 # ----------------------------
 # Merging Functions Tests
 # ----------------------------
@@ -184,28 +223,27 @@ class GetProgressPercentageTest(TypedDict):
     "case", 
     cast(list[AlignSubsNeighbourTest], load_test_cases(DATA_ALIGN_SUBS_NEIGHBOUR))
 )
-@pytest.mark.parametrize("stop", [True, False])
-def test_align_subs_using_neighbours(case: AlignSubsNeighbourTest, stop: bool) -> None:
+def test_align_subs_using_neighbours(
+        case: AlignSubsNeighbourTest,
+        align_neighbour_score_pairs: dict[str, ScoreTensorPairs]
+    ) -> None:
     """
     Test the align_subs_using_neighbours function for subtitle alignment refinement and
     early stopping.
 
+    The refinement is run to completion first, then again with the stop bit set, which 
+    must leave the input subtitles unchanged.
+
     Args:
         case (AlignSubsNeighbourTest): Test case data loaded from YAML.
-        stop (bool): Whether to simulate early stopping.
+        align_neighbour_score_pairs (dict[str, ScoreTensorPairs]): Pre-converted 
+            score tensors keyed by test case name.
     """
-    score_pairs = []
-    for pair in case["scores"]:
-        left = torch.tensor(pair["left"])
-        right = torch.tensor(pair["right"])
-        score_pairs.append((left, right))
-
-    dummy_score_fn = make_interleaved_score(score_pairs)
+    dummy_score_fn = make_interleaved_score(align_neighbour_score_pairs[case["name"]])
 
     with patch("duosubs.core.merger.Merger._compute_score",
                side_effect=dummy_score_fn
     ):
-        subs = [SubtitleField(**s) for s in case["subs"]]
         secondary_subs_data = SubtitleData(
             tokens=case["secondary_tokens"],
             styles_tokens=case["secondary_styles_tokens"]
@@ -214,49 +252,53 @@ def test_align_subs_using_neighbours(case: AlignSubsNeighbourTest, stop: bool) -
             SubtitleData(),
             secondary_subs_data
         )
-        stop_bit = [True] if stop else [False]
-        stage_number = 0
         dummy_model = cast(SentenceTransformer, DummyModel())
+
         output_subs, stage_number = merger.align_subs_using_neighbours(
-            subs, case["subtitle_window_size"], dummy_model, stage_number, stop_bit
+            build_subtitle_fields(case["subs"]),
+            case["subtitle_window_size"],
+            dummy_model,
+            0,
+            [False]
         )
-        expected_subs = (
-            [SubtitleField(**s) for s in case["subs"]] if stop
-            else [SubtitleField(**s) for s in case["expected_subs"]]
+        assert stage_number == 1
+        assert_subtitle_fields_equal(
+            output_subs, build_subtitle_fields(case["expected_subs"])
+        )
+
+        stopped_subs, stage_number = merger.align_subs_using_neighbours(
+            build_subtitle_fields(case["subs"]),
+            case["subtitle_window_size"],
+            dummy_model,
+            0,
+            [True]
         )
         assert stage_number == 1
-        assert_subtitle_fields_equal(output_subs, expected_subs)
+        assert_subtitle_fields_equal(stopped_subs, build_subtitle_fields(case["subs"]))
 
 @pytest.mark.parametrize(
     "case",
     cast(list[EliminateNewlineTest], load_test_cases(DATA_ELIMINATE_NEWLINE))
 )
-@pytest.mark.parametrize("stop", [True, False])
-def test_eliminate_unnecessary_newline(
-        case: EliminateNewlineTest,
-        stop: bool
-    ) -> None:
+def test_eliminate_unnecessary_newline(case: EliminateNewlineTest) -> None:
     """
     Test the eliminate_unnecessary_newline function for cleaning up newlines in 
     subtitles and early stopping.
 
     Args:
         case (EliminateNewlineTest): Test case data loaded from YAML.
-        stop (bool): Whether to simulate early stopping.
     """
-    stop_bit = [True] if stop else [False]
-    sub = SubtitleField(
-        primary_text=case["text"],
-        secondary_text=case["text"]
-    )
     merger = Merger(SubtitleData(), SubtitleData())
-    result = merger.eliminate_unnecessary_newline([sub], stop_bit)
-    if stop:
-        assert result[0].primary_text == case["text"]
-        assert result[0].secondary_text == case["text"]
-    else:
-        assert result[0].primary_text == case["expected"]
-        assert result[0].secondary_text == case["expected"]
+
+    sub = SubtitleField(primary_text=case["text"], secondary_text=case["text"])
+    result = merger.eliminate_unnecessary_newline([sub], [False])
+    assert result[0].primary_text == case["expected"]
+    assert result[0].secondary_text == case["expected"]
+
+    sub = SubtitleField(primary_text=case["text"], secondary_text=case["text"])
+    result = merger.eliminate_unnecessary_newline([sub], [True])
+    assert result[0].primary_text == case["text"]
+    assert result[0].secondary_text == case["text"]
 
 @pytest.mark.parametrize(
     "case",
@@ -273,7 +315,7 @@ def test_align_subs_with_secondary_tokens(case: AlignSubsWithSecTokensTest) -> N
     Args:
         case (AlignSubsWithSecTokensTest): Test case data loaded from YAML.
     """
-    primary_subs = [SubtitleField(**s) for s in case["primary_subs"]]
+    primary_subs = build_subtitle_fields(case["primary_subs"])
     primary_subs_data = SubtitleData(subs=primary_subs)
     secondary_subs_data = SubtitleData(
         tokens=case["secondary_tokens"],
@@ -281,7 +323,7 @@ def test_align_subs_with_secondary_tokens(case: AlignSubsWithSecTokensTest) -> N
     )
     merger = Merger(primary_subs_data, secondary_subs_data)
     output_subs = merger._align_subs_with_secondary_tokens(case["dtw_path"])
-    expected_subs = [SubtitleField(**s) for s in case["expected_subs"]]
+    expected_subs = build_subtitle_fields(case["expected_subs"])
 
     assert_subtitle_fields_equal(output_subs, expected_subs)
 
@@ -306,11 +348,8 @@ def test_filter_and_extract_non_overlap_subs(
         case (NonOverlapMergeTest): Test case data loaded from YAML.
         stop (bool): Whether to simulate early stopping.
     """
-    input_subs = [SubtitleField(**s) for s in case["input_subs"]]
-    for sub in input_subs:
-        a, b = sub.primary_token_spans
-        sub.primary_token_spans = (a, b)
-    ref_subs = [SubtitleField(**s) for s in case["ref_subs"]]
+    input_subs = build_subtitle_fields(case["input_subs"])
+    ref_subs = build_subtitle_fields(case["ref_subs"])
 
     output_subs, output_token_spans = Merger._filter_and_extract_non_overlap_subs(
         input_subs,
@@ -322,11 +361,11 @@ def test_filter_and_extract_non_overlap_subs(
     output_token_spans.sort()
 
     expected_subs = (
-        [SubtitleField(**s) for s in case["expected_primary"]]
+        build_subtitle_fields(case["expected_primary"])
         if input_is_primary
-        else [SubtitleField(**s) for s in case["expected_secondary"]]
+        else build_subtitle_fields(case["expected_secondary"])
     )
-    expected_input_subs = [SubtitleField(**s) for s in case["expected_input_subs"]]
+    expected_input_subs = build_subtitle_fields(case["expected_input_subs"])
     expected_token_spans = [tuple(spans) for spans in case["expected_token_spans"]]
 
     assert_subtitle_fields_equal(output_subs, expected_subs)
@@ -395,18 +434,9 @@ def test_remove_extended_segments(case: RemoveExtendedSegments) -> None:
     Args:
         case (RemoveExtendedSegments): Test case data loaded from YAML.
     """
-    def _obtain_subtitlefield_lists(
-            data: list[SubtitleFieldDict]
-        ) -> list[SubtitleField]:
-        subs = [SubtitleField(**s) for s in data]
-        for sub in subs:
-            start, end = sub.secondary_token_spans
-            sub.secondary_token_spans = (start, end)
-        return subs
-
-    input_subs = _obtain_subtitlefield_lists(case["subs"])
-    expected_updated_subs = _obtain_subtitlefield_lists(case["non_extended_cut_subs"])
-    expected_extended_cut_subs = _obtain_subtitlefield_lists(case["extended_cut_subs"])
+    input_subs = build_subtitle_fields(case["subs"])
+    expected_updated_subs = build_subtitle_fields(case["non_extended_cut_subs"])
+    expected_extended_cut_subs = build_subtitle_fields(case["extended_cut_subs"])
     
     updated_subs, extended_cut_subs = Merger._remove_extended_segments(
         case["extended_cut_idx_spans"],
@@ -534,7 +564,10 @@ class DummyModel:
             **_kwargs: Any
         ) -> torch.Tensor:
         """
-        Simulate encoding of input texts into random tensor embeddings.
+        Simulate encoding of input texts into tensor embeddings.
+
+        The embeddings are left uninitialized, since the tests patch the score 
+        computation and never read their values.
 
         Args:
             texts (str): Input text(s) to encode.
@@ -542,9 +575,9 @@ class DummyModel:
             **_kwargs: Additional keyword arguments (ignored).
 
         Returns:
-            torch.Tensor: Random tensor simulating sentence embeddings.
+            torch.Tensor: Uninitialized tensor shaped like sentence embeddings.
         """
-        return torch.rand(len(texts), 384)
+        return torch.empty(len(texts), 384)
 
 # ----------------------------
 # Helper functions
@@ -581,11 +614,16 @@ class Scorer:
     This class implements a callable that returns the next tensor from a predefined 
     list of tensors when called.
     """
+    __slots__ = ("index", "scores")
+
     def __init__(self, scores: list[torch.Tensor]):
-        self.iterator = iter(scores)
+        self.scores = scores
+        self.index = 0
 
     def __call__(self, *_args: Any, **_kwargs: Any) -> torch.Tensor:
-        return next(self.iterator)
+        score = self.scores[self.index]
+        self.index += 1
+        return score
 
 def make_sequential_score(scores: list[torch.Tensor]) -> Callable[..., torch.Tensor]:
     """
@@ -613,5 +651,4 @@ def make_interleaved_score(
     Returns:
         Callable: Function that returns the next tensor on each call.
     """
-    flat_scores = [s for pair in score_pairs for s in pair]
-    return Scorer(flat_scores)
+    return Scorer(list(chain.from_iterable(score_pairs)))
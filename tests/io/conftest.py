@@ -0,0 +1,21 @@
+"""
+Shared pytest fixtures for the duosubs.io test modules.
+"""
+
+import pytest
+
+from duosubs.io.loader import load_file_edit
+from tests.common_utils.utils import SUB_COMPRESSED_DATA, EditData
+
+
+@pytest.fixture(scope="session")
+def edit_data() -> EditData:
+    """
+    Load the compressed edit subtitle file once per test session.
+
+    The returned styles are shared across tests and must be treated as read-only.
+
+    Returns:
+        EditData: Merged subtitles, primary styles and secondary styles.
+    """
+    return load_file_edit(str(SUB_COMPRESSED_DATA))
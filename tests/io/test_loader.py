@@ -13,8 +13,13 @@ import pysubs2
 import pytest
 
 from duosubs.io.loader import load_file_edit, load_subs
-from duosubs.subtitle.field import SubtitleField
-from tests.common_utils.utils import SubtitleFieldDict, load_test_cases
+from duosubs.subtitle.data import SubtitleData
+from tests.common_utils.utils import (
+    EditData,
+    SubtitleFieldDict,
+    build_subtitle_fields,
+    load_test_cases,
+)
 
 # Test subtitle paths
 SUB_PATH: Path = Path(__file__).parent / "sub_data"
@@ -52,6 +57,32 @@ class FileEditSubsFieldTest(TypedDict):
     """
     subs: list[SubtitleFieldDict]
 
+# ----------------------------
+# Fixtures
+# ----------------------------
+
+@pytest.fixture(scope="session")
+def loaded_subs() -> SubtitleData:
+    """
+    Fixture loading the trimmed test subtitle once per session. Tests only read from 
+    the returned data.
+
+    Returns:
+        SubtitleData: Loaded subtitles, tokens and styles.
+    """
+    return load_subs(TEST_SUB_PATH)
+
+@pytest.fixture(scope="session")
+def loaded_file_edit() -> EditData:
+    """
+    Fixture loading the trimmed compressed edit file once per session. Tests only read 
+    from the returned data.
+
+    Returns:
+        EditData: Merged subtitles, primary styles and secondary styles.
+    """
+    return load_file_edit(TEST_SUB_COMPRESSED_PATH)
+
 # ------------------------
 # Subtitle Loading Tests
 # ------------------------
@@ -60,19 +91,17 @@ class FileEditSubsFieldTest(TypedDict):
     "case",
     cast(list[SubsInSubsFieldTest], load_test_cases(DATA_SUBS_IN_SUBS_FIELD))
 )
-def test_load_subs(case: SubsInSubsFieldTest) -> None:
+def test_load_subs(case: SubsInSubsFieldTest, loaded_subs: SubtitleData) -> None:
     """
     Test load_subs function for loading and tokenizing subtitles, and extracting style
     tokens.
 
     Args:
         case (SubsInSubsFieldTest): Test case data loaded from YAML.
+        loaded_subs (SubtitleData): Session-scoped result of load_subs.
     """
-    subs_data = load_subs(TEST_SUB_PATH)
-    expected_subs = [SubtitleField(**s) for s in case["subs"]]
-    for sub in expected_subs:
-        a, b = sub.primary_token_spans
-        sub.primary_token_spans = (a, b)
+    subs_data = loaded_subs
+    expected_subs = build_subtitle_fields(case["subs"])
 
     assert subs_data.subs == expected_subs
     assert subs_data.tokens == case["tokens"]
@@ -89,20 +118,20 @@ def test_load_subs(case: SubsInSubsFieldTest) -> None:
     "data",
     cast(list[FileEditSubsFieldTest], load_test_cases(DATA_FILE_EDIT_SUBS_FIELD))
 )
-def test_load_file_edit(data: FileEditSubsFieldTest) -> None:
+def test_load_file_edit(
+    data: FileEditSubsFieldTest,
+    loaded_file_edit: EditData
+) -> None:
     """
     Test load_file_edit for loading subtitle edit files and verifying subtitle and style
     content.
 
     Args:
         data (FileEditSubsFieldTest): Test case data loaded from YAML.
+        loaded_file_edit (EditData): Session-scoped result of load_file_edit.
     """
-    (
-        output_subs,
-        primary_styles,
-        secondary_styles
-    ) = load_file_edit(TEST_SUB_COMPRESSED_PATH)
-    expected_subs = [SubtitleField(**s) for s in data["subs"]]
+    output_subs, primary_styles, secondary_styles = loaded_file_edit
+    expected_subs = build_subtitle_fields(data["subs"])
 
     assert len(output_subs) == len(expected_subs)
     for actual, expected in zip(output_subs, expected_subs, strict=False):
@@ -6,12 +6,11 @@ subtitle files in various formats, including edit, combined, and separate subtit
 streams. It also includes helper functions for correctness checks.
 """
 
+import copy
 import gzip
-import io
-import json
-from math import floor
 from pathlib import Path
 
+import orjson
 import pysubs2
 import pytest
 
@@ -27,26 +26,32 @@ from duosubs.io.writer import (
     save_memory_separate,
 )
 from duosubs.subtitle.field import SubtitleField
+from tests.common_utils.utils import EditData
 
 # Test subtitle paths
 SUB_PATH: Path = Path(__file__).parent / "sub_data"
-SUB_COMPRESSED_DATA: Path = SUB_PATH / "TOS-en-cht.json.gz"
 COMBINED_PRIMARY_ABOVE: Path = SUB_PATH / "combined/primary_above/TOS-en-cht"
 COMBINED_SECONDARY_ABOVE: Path = SUB_PATH / "combined/secondary_above/TOS-en-cht"
 
+# Parametrize ids
+IS_MEMORY_IDS: list[str] = ["memory", "file"]
+RETAIN_NEWLINE_IDS: list[str] = ["newline", "no_newline"]
+
 # ----------------------------
 # File Edit Round Trip Tests
 # ----------------------------
 
-def test_file_edit_round_trip(tmp_path: Path) -> None:
+def test_file_edit_round_trip(tmp_path: Path, edit_data: EditData) -> None:
     """
     Test save_file_edit and load_file_edit functions for round-trip saving and loading
     of compressed edit subtitle files.
 
     Args:
         tmp_path (Path): Temporary directory provided by pytest for file output.
+        edit_data (EditData): Session-scoped merged subtitles and styles.
     """
-    subs_m, styles_p, styles_s = load_file_edit(str(SUB_COMPRESSED_DATA))
+    subs_m, styles_p, styles_s = edit_data
+    subs_m = copy.copy(subs_m)
     output = tmp_path / 'test.json'
     save_file_edit(subs_m, styles_p, styles_s, str(output))
     output = tmp_path / 'test.json.gz'
@@ -62,20 +67,19 @@ def test_file_edit_round_trip(tmp_path: Path) -> None:
     assert styles_p.styles == new_styles_p.styles
     assert styles_s.styles == new_styles_s.styles
 
-def test_memory_edit_round_trip() -> None:
+def test_memory_edit_round_trip(edit_data: EditData) -> None:
     """
     Test load_file_edit and save_memory_edit functions for round-trip saving and loading
     of compressed edit subtitle files in memory.
+
+    Args:
+        edit_data (EditData): Session-scoped merged subtitles and styles.
     """
-    subs_m, styles_p, styles_s = load_file_edit(str(SUB_COMPRESSED_DATA))
+    subs_m, styles_p, styles_s = edit_data
+    subs_m = copy.copy(subs_m)
     compressed_data = save_memory_edit(subs_m, styles_p, styles_s)
 
-    decompressed_buffer = io.BytesIO(compressed_data)
-    with gzip.GzipFile(fileobj=decompressed_buffer, mode="r") as gz:
-        decompressed_bytes = gz.read()
-        data = _decode(
-            json.loads(decompressed_bytes.decode("utf-8"))
-        )
+    data = _decode(orjson.loads(gzip.decompress(compressed_data)))
 
     new_styles_p = _deserialize_styles(data['primary_styles'])
     new_styles_s = _deserialize_styles(data['secondary_styles'])
@@ -90,12 +94,24 @@ def test_memory_edit_round_trip() -> None:
 # ----------------------------
 
 @pytest.mark.parametrize("desc, secondary_above, retain_newline, path_prefix", [
-    ("primary_newline", False, True, COMBINED_PRIMARY_ABOVE),
-    ("primary_no_newline", False, False, COMBINED_PRIMARY_ABOVE),
-    ("secondary_newline", True, True, COMBINED_SECONDARY_ABOVE),
-    ("secondary_no_newline", True, False, COMBINED_SECONDARY_ABOVE),
+    pytest.param(
+        "primary_newline", False, True, COMBINED_PRIMARY_ABOVE,
+        id="primary_newline"
+    ),
+    pytest.param(
+        "primary_no_newline", False, False, COMBINED_PRIMARY_ABOVE,
+        id="primary_no_newline"
+    ),
+    pytest.param(
+        "secondary_newline", True, True, COMBINED_SECONDARY_ABOVE,
+        id="secondary_newline"
+    ),
+    pytest.param(
+        "secondary_no_newline", True, False, COMBINED_SECONDARY_ABOVE,
+        id="secondary_no_newline"
+    ),
 ])
-@pytest.mark.parametrize("is_memory", [True, False])
+@pytest.mark.parametrize("is_memory", [True, False], ids=IS_MEMORY_IDS)
 @pytest.mark.parametrize("ext", SUPPORTED_SUB_EXT)
 def test_combined_round_trip(
         tmp_path: Path,
@@ -104,7 +120,8 @@ def test_combined_round_trip(
         desc: str,
         secondary_above: bool,
         retain_newline: bool,
-        path_prefix: str
+        path_prefix: Path,
+        edit_data: EditData
     ) -> None:
     """
     Test save_memory_combined and save_file_combined functions for round-trip saving and
@@ -117,11 +134,13 @@ def test_combined_round_trip(
         desc (str): Description of the test case.
         secondary_above (bool): If True, secondary text is above primary.
         retain_newline (bool): Whether to retain line breaks.
-        path_prefix (str): Path prefix for test files.
+        path_prefix (Path): Path prefix for test files.
+        edit_data (EditData): Session-scoped merged subtitles and styles.
     """
     suffix = "_".join(desc.split("_")[1:])
     test_path = Path(f"{path_prefix}_{suffix}.{ext}")
-    subs_m, styles_p, styles_s = load_file_edit(str(SUB_COMPRESSED_DATA))
+    subs_m, styles_p, styles_s = edit_data
+    subs_m = copy.copy(subs_m)
     if is_memory:
         subs_str = save_memory_combined(
             subs_m,
@@ -150,14 +169,15 @@ def test_combined_round_trip(
 # Separate Subtitle Round Trip Tests
 # ----------------------------
 
-@pytest.mark.parametrize("retain_newline", [True, False])
-@pytest.mark.parametrize("is_memory", [True, False])
+@pytest.mark.parametrize("retain_newline", [True, False], ids=RETAIN_NEWLINE_IDS)
+@pytest.mark.parametrize("is_memory", [True, False], ids=IS_MEMORY_IDS)
 @pytest.mark.parametrize("ext", SUPPORTED_SUB_EXT)
 def test_separate_round_trip(
     tmp_path: Path,
     ext: str,
     is_memory: bool,
-    retain_newline: bool
+    retain_newline: bool,
+    edit_data: EditData
     ) -> None:
     """
     Test save_memory_separate and save_file_separate functions for round-trip saving and
@@ -168,8 +188,10 @@ def test_separate_round_trip(
         ext (str): Subtitle file extension/format.
         is_memory (bool): Whether to test in-memory or file-based saving.
         retain_newline (bool): Whether to retain line breaks.
+        edit_data (EditData): Session-scoped merged subtitles and styles.
     """
-    subs_m, styles_p, styles_s = load_file_edit(str(SUB_COMPRESSED_DATA))
+    subs_m, styles_p, styles_s = edit_data
+    subs_m = copy.copy(subs_m)
     if is_memory:
         subs_p_str, subs_s_str = save_memory_separate(
             subs_m,
@@ -223,12 +245,8 @@ def assert_combined_correctness(
         assert subs_save.styles == subs_ori.styles
 
     for sub_s, sub_o in zip(subs_save, subs_ori, strict=False):
-        if ext == 'tmp':
-            assert to_tmp_time(sub_s.start) == to_tmp_time(sub_o.start)
-        else:
-            assert sub_s.start == sub_o.start
-            assert sub_s.end == sub_o.end
-
+        assert sub_s.start == sub_o.start
+        assert sub_s.end == sub_o.end
         assert sub_s.text == sub_o.text
 
 def assert_separate_correctness(
@@ -259,14 +277,10 @@ def assert_separate_correctness(
         assert subs_s.styles == styles_s.styles
 
     for sub_p, sub_s, sub_ori in zip(subs_p, subs_s, subs_m, strict=False):
-        if ext == 'tmp':
-            assert to_tmp_time(sub_p.start) == to_tmp_time(sub_ori.start)
-            assert to_tmp_time(sub_s.start) == to_tmp_time(sub_ori.start)
-        else:
-            assert sub_p.start == sub_ori.start
-            assert sub_s.start == sub_ori.start
-            assert sub_p.end == sub_ori.end
-            assert sub_s.end == sub_ori.end
+        assert sub_p.start == sub_ori.start
+        assert sub_s.start == sub_ori.start
+        assert sub_p.end == sub_ori.end
+        assert sub_s.end == sub_ori.end
 
         if retain_newline:
             expected_p = sub_ori.primary_text.strip()
@@ -277,15 +291,3 @@ def assert_separate_correctness(
 
         assert sub_p.text == expected_p
         assert sub_s.text == expected_s
-
-def to_tmp_time(time: int) -> int:
-    """
-    Helper to convert time from milliseconds to seconds used in TMP format.
-
-    Args:
-        time (int): Time in milliseconds.
-
-    Returns:
-        int: Time in seconds (floored to nearest lower integer).
-    """
-    return floor(time / 1000)
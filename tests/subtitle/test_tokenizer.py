@@ -7,7 +7,9 @@ tokenization, leading dash combination, and language code detection in
 SubtitleTokenizer.
 """
 
+from functools import lru_cache
 from pathlib import Path
+from re import Pattern
 from typing import TypedDict, cast
 from unittest.mock import MagicMock, patch
 
@@ -111,20 +113,10 @@ def test_tokenize_sentence(case: TokenizeSentence) -> None:
     Args:
         case (TokenizeSentence): Test case data loaded from YAML.
     """
-    subs = SSAFile()
-    subs.events.append(SSAEvent(start=0, end=1000, text=case["text"]))
-
-    with patch.object(
-        SubtitleTokenizer,
-        "_detect_language_code",
-        return_value=case["language"]
-    ):
-        pattern = SubtitleTokenizer.detect_regex_pattern(subs)
-        result = [
-            SubtitleTokenizer.tokenize_sentence(pattern, sub.text) for sub in subs
-        ]
+    pattern = _pattern_for_language(case["language"])
+    result = SubtitleTokenizer.tokenize_sentence(pattern, case["text"])
 
-    assert result[0] == case["expected"]
+    assert result == case["expected"]
 
 # ----------------------------
 # Combine Leading Dash Tests
@@ -203,3 +195,26 @@ def test_detect_language_code_empty() -> None:
 
         result = SubtitleTokenizer._detect_language_code(subs)
         assert result is None
+
+# ----------------------------
+# Helper functions
+# ----------------------------
+
+@lru_cache(maxsize=None)
+def _pattern_for_language(language: str) -> Pattern[str]:
+    """
+    Helper to build the sentence-splitting regex pattern for a language once and reuse
+    it across test cases sharing the same language.
+
+    Args:
+        language (str): Language code returned by the mocked language detector.
+
+    Returns:
+        Pattern[str]: The compiled regex pattern for sentence splitting.
+    """
+    with patch.object(
+        SubtitleTokenizer,
+        "_detect_language_code",
+        return_value=language
+    ):
+        return SubtitleTokenizer.detect_regex_pattern(SSAFile())
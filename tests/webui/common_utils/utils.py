@@ -1,13 +1,20 @@
-
 """
 Utility functions for web UI testing: free port selection and server readiness polling.
 """
 
 import socket
 import time
+from urllib.parse import urlsplit
 
 import requests
+from requests.adapters import HTTPAdapter
+
+# Sentence transformer model used by the web UI tests
+MODEL_NAME: str = "sentence-transformers/all-MiniLM-L6-v2"
 
+# Keep-alive session reused across readiness polls
+_session = requests.Session()
+_session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
 
 def get_free_port() -> int:
     """
@@ -16,15 +23,16 @@ def get_free_port() -> int:
     Returns:
         int: An available port number.
     """
-    s = socket.socket()
-    s.bind(('', 0))
-    port = int(s.getsockname()[1])
-    s.close()
-    return port
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        s.bind(('', 0))
+        return int(s.getsockname()[1])
 
 def wait_for_server(url: str, timeout: float = 20) -> bool:
     """
-    Poll the server until it's ready (HTTP 200) or timeout is reached.
+    Poll the server until it's ready (HTTP 200) or timeout is reached, backing off
+    exponentially between attempts. A cheap TCP connect probe gates each HTTP request
+    so no request is sent before the port accepts connections.
 
     Args:
         url (str): The server URL to poll.
@@ -36,13 +44,18 @@ def wait_for_server(url: str, timeout: float = 20) -> bool:
     Raises:
         RuntimeError: If the server did not become ready in time.
     """
-    start = time.time()
-    while time.time() - start < timeout:
+    parts = urlsplit(url)
+    address = (parts.hostname or "127.0.0.1", parts.port or 80)
+    deadline = time.monotonic() + timeout
+    delay = 0.05
+    while time.monotonic() < deadline:
         try:
-            r = requests.get(url)
+            socket.create_connection(address, timeout=0.1).close()
+            r = _session.get(url, timeout=(0.5, 5))
             if r.status_code == 200:
                 return True
-        except requests.exceptions.ConnectionError:
+        except (OSError, requests.exceptions.RequestException):
             pass
-        time.sleep(0.25)
+        time.sleep(delay)
+        delay = min(delay * 1.6, 0.5)
     raise RuntimeError(f"Server at {url} didn't become ready in {timeout} seconds")
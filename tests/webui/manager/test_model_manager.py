@@ -5,25 +5,59 @@ unloading, and memory release logic.
 """
 
 import weakref
+from contextlib import contextmanager
+from typing import Any, Callable, Generator
 from unittest.mock import MagicMock, patch
 
+import pytest
 from sentence_transformers import SentenceTransformer
 
 from duosubs.webui.manager.model_manager import ModelPool
 
+# ----------------------------
+# Fixtures
+# ----------------------------
 
-def test_load_model_first_time() -> None:
+@pytest.fixture(autouse=True)
+def reset_model_pool() -> Generator[None, None, None]:
+    """
+    Fixture emptying the shared ModelPool before and after each test.
+
+    Yields:
+        None
+    """
+    ModelPool._models.clear()
+    yield
+    ModelPool._models.clear()
+
+@pytest.fixture(scope="module")
+def dummy_model() -> MagicMock:
+    """
+    Fixture providing a SentenceTransformer-specced mock shared by the module, so the 
+    spec introspection of SentenceTransformer runs only once.
+
+    Returns:
+        MagicMock: Mock model instance.
+    """
+    return MagicMock(spec=SentenceTransformer)
+
+# ----------------------------
+# Load and Unload Tests
+# ----------------------------
+
+def test_load_model_first_time(dummy_model: MagicMock) -> None:
     """
     Test loading a model for the first time adds it to the pool and calls the loader.
+
+    Args:
+        dummy_model (MagicMock): Shared mock model instance.
     """
     session_id = "user1234"
     model_name = "test-model"
     device = "cpu"
 
-    dummy_model = MagicMock(spec=SentenceTransformer)
     loader_fn = MagicMock(return_value=dummy_model)
 
-    ModelPool._models.clear()
     model = ModelPool.load_model(session_id, model_name, device, loader_fn)
 
     assert model is dummy_model
@@ -34,19 +68,20 @@ def test_load_model_first_time() -> None:
     assert session_id in sessions
     loader_fn.assert_called_once()
 
-def test_load_model_reuse() -> None:
+def test_load_model_reuse(dummy_model: MagicMock) -> None:
     """
     Test loading a model for a second session reuses the same model instance.
+
+    Args:
+        dummy_model (MagicMock): Shared mock model instance.
     """
     session_id1 = "user1234"
     session_id2 = "user2456"
     model_name = "test-model"
     device = "cpu"
 
-    dummy_model = MagicMock(spec=SentenceTransformer)
     loader_fn = MagicMock(return_value=dummy_model)
 
-    ModelPool._models.clear()
     ModelPool.load_model(session_id1, model_name, device, loader_fn)
     model = ModelPool.load_model(session_id2, model_name, device, loader_fn)
 
@@ -58,19 +93,19 @@ def test_load_model_reuse() -> None:
 
     loader_fn.assert_called_once()
 
-def test_unload_model_removes_session_and_model() -> None:
+def test_unload_model_removes_session_and_model(dummy_model: MagicMock) -> None:
     """
     Test unloading the last session removes the model from the pool and calls 
     _wait_for_release.
+
+    Args:
+        dummy_model (MagicMock): Shared mock model instance.
     """
     session_id = "user1234"
     model_name = "test-model"
     device = "cuda"
     key = (model_name, device)
 
-    dummy_model = MagicMock(spec=SentenceTransformer)
-
-    ModelPool._models.clear()
     ModelPool._models[key] = (dummy_model, {session_id})
 
     with patch.object(ModelPool, "_wait_for_release") as mock_wait:
@@ -81,9 +116,12 @@ def test_unload_model_removes_session_and_model() -> None:
         called_ref = mock_wait.call_args.args[0]
         assert called_ref() is dummy_model
 
-def test_unload_model_only_removes_session() -> None:
+def test_unload_model_only_removes_session(dummy_model: MagicMock) -> None:
     """
     Test unloading one of multiple sessions only removes that session, not the model.
+
+    Args:
+        dummy_model (MagicMock): Shared mock model instance.
     """
     session_id1 = "user1234"
     session_id2 = "user2468"
@@ -91,8 +129,6 @@ def test_unload_model_only_removes_session() -> None:
     device = "cpu"
     key = (model_name, device)
 
-    dummy_model = MagicMock(spec=SentenceTransformer)
-    ModelPool._models.clear()
     ModelPool._models[key] = (dummy_model, {session_id1, session_id2})
 
     with patch.object(ModelPool, "_wait_for_release") as mock_wait:
@@ -104,9 +140,17 @@ def test_unload_model_only_removes_session() -> None:
         assert session_id2 in sessions
         mock_wait.assert_not_called()
 
-def test_wait_for_release_success() -> None:
+# ----------------------------
+# Memory Release Tests
+# ----------------------------
+
+@pytest.mark.parametrize("cuda_available", [True, False], ids=["cuda", "cpu"])
+def test_wait_for_release_success(cuda_available: bool) -> None:
     """
     Test that _wait_for_release returns early if the model is released before timeout.
+
+    Args:
+        cuda_available (bool): Whether CUDA is reported as available.
     """
     class DummyModel:
         pass
@@ -116,23 +160,23 @@ def test_wait_for_release_success() -> None:
 
     release_check_results = [False, True]
 
-    with patch("gc.collect"), \
-        patch("torch.cuda.is_available", return_value=True), \
-        patch("torch.cuda.empty_cache"), \
-        patch("torch.cuda.ipc_collect"), \
-        patch(
-            "duosubs.webui.manager.model_manager.ModelPool._is_model_released",
+    with patch_release_env(
+            cuda_available,
             side_effect=lambda ref: release_check_results.pop(0)
-        ), \
-        patch("time.sleep", return_value=None), \
-        patch("time.time") as mock_time:
-        
-        mock_time.side_effect = [0, 0.1, 0.2]  # each iteration
+        ) as mock_empty_cache, \
+        patch("time.time", side_effect=fake_clock(step=0.1)):
+
         ModelPool._wait_for_release(weak_ref, timeout=1, interval=0.1)
 
-def test_wait_for_release_timeout() -> None:
+        assert mock_empty_cache.call_count == (2 if cuda_available else 0)
+
+@pytest.mark.parametrize("cuda_available", [True, False], ids=["cuda", "cpu"])
+def test_wait_for_release_timeout(cuda_available: bool) -> None:
     """
     Test that _wait_for_release triggers a warning if the model is not released in time.
+
+    Args:
+        cuda_available (bool): Whether CUDA is reported as available.
     """
     class DummyModel:
         pass
@@ -140,18 +184,62 @@ def test_wait_for_release_timeout() -> None:
     model = DummyModel()
     weak_ref = weakref.ref(model)
 
-    with patch("gc.collect"), \
-        patch("torch.cuda.is_available", return_value=True), \
-        patch("torch.cuda.empty_cache"), \
-        patch("torch.cuda.ipc_collect"), \
-        patch(
-            "duosubs.webui.manager.model_manager.ModelPool._is_model_released",
-            return_value=False
-        ), \
-        patch("time.sleep", return_value=None), \
-        patch("time.time", side_effect=[0, 1, 2, 3, 4, 5, 6]), \
+    with patch_release_env(cuda_available, return_value=False), \
+        patch("time.time", side_effect=fake_clock(step=1)), \
         patch("duosubs.webui.manager.model_manager.gr.Warning") as mock_warning:
 
         ModelPool._wait_for_release(weak_ref, timeout=5, interval=1)
 
         mock_warning.assert_called_once()
+
+# ----------------------------
+# Helper functions
+# ----------------------------
+
+def fake_clock(step: float) -> Callable[[], float]:
+    """
+    Helper to build a fake clock that advances by a fixed step on every call, so tests 
+    do not depend on how many times the code under test reads the time.
+
+    Args:
+        step (float): Seconds added to the clock on each call.
+
+    Returns:
+        Callable[[], float]: Function returning monotonically increasing times.
+    """
+    now = 0.0
+
+    def tick() -> float:
+        nonlocal now
+        now += step
+        return now
+
+    return tick
+
+@contextmanager
+def patch_release_env(
+    cuda_available: bool,
+    **release_check: Any
+) -> Generator[MagicMock, None, None]:
+    """
+    Helper to patch garbage collection, CUDA cache handling, sleeping and the release 
+    check used by ModelPool._wait_for_release.
+
+    Args:
+        cuda_available (bool): Value returned by torch.cuda.is_available.
+        **release_check: Keyword arguments (return_value or side_effect) for the 
+            patched ModelPool._is_model_released.
+
+    Yields:
+        MagicMock: The patched torch.cuda.empty_cache.
+    """
+    with patch("gc.collect"), \
+        patch("torch.cuda.is_available", return_value=cuda_available), \
+        patch("torch.cuda.empty_cache") as mock_empty_cache, \
+        patch("torch.cuda.ipc_collect"), \
+        patch(
+            "duosubs.webui.manager.model_manager.ModelPool._is_model_released",
+            **release_check
+        ), \
+        patch("time.sleep", return_value=None):
+        yield mock_empty_cache
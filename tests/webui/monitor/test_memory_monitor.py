@@ -33,7 +33,8 @@ def test_get_memory_status_table(
     vram: tuple[str, float, int, int]
 ) -> None:
     """
-    Test LiveMemoryMonitor._get_memory_status_table for correct DataFrame output.
+    Test LiveMemoryMonitor._get_memory_status_table for correct DataFrame output, and 
+    that GPU handles and names are looked up only once across refreshes.
 
     Args:
         ram (tuple[float, int, int]): System RAM stats as (percent, used, total).
@@ -82,9 +83,14 @@ def test_get_memory_status_table(
             total=vram[3]
         )
 
+        monitor._get_memory_status_table()
         df = monitor._get_memory_status_table()
         gib = 1024**3
 
+        mock_get_handle.assert_called_once_with(0)
+        mock_get_name.assert_called_once()
+        assert mock_get_mem_info.call_count == 2
+
         assert isinstance(df, pd.DataFrame)
         assert df.shape[0] == 2
 
@@ -0,0 +1,32 @@
+"""
+Shared pytest fixtures for the DuoSubs web UI Playwright tests.
+"""
+
+from pathlib import Path
+
+import pytest
+from filelock import FileLock
+from sentence_transformers import SentenceTransformer
+
+from tests.webui.common_utils.utils import MODEL_NAME
+
+
+@pytest.fixture(scope="session")
+def cached_model(tmp_path_factory: pytest.TempPathFactory) -> str:
+    """
+    Load the sentence transformer model used by the UI tests once, so that only the 
+    files the Gradio server needs are in the Hugging Face cache before it starts.
+
+    Under pytest-xdist, workers share a file lock in the common base temp directory, so 
+    only the first worker downloads and the others read from the cache.
+
+    Args:
+        tmp_path_factory (pytest.TempPathFactory): Factory for the session temp paths.
+
+    Returns:
+        str: The cached model name.
+    """
+    lock_path: Path = tmp_path_factory.getbasetemp().parent / "model_download.lock"
+    with FileLock(str(lock_path)):
+        SentenceTransformer(MODEL_NAME, device="cpu")
+    return MODEL_NAME
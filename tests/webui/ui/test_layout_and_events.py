@@ -3,23 +3,34 @@
 End-to-end Playwright and pytest tests for DuoSubs web UI layout and event logic.
 
 Tests merging workflow, UI state, file export options, and output correctness.
+
+Each pytest-xdist worker starts its own Gradio server on a free port, so the tests can 
+be spread across workers with ``pytest -n auto --dist load tests/webui/ui``.
 """
 
-import fnmatch
 import multiprocessing
-import random
-import time
 import zipfile
+from contextlib import nullcontext
+from functools import lru_cache
+from multiprocessing.synchronize import Event
 from pathlib import Path
-from typing import Generator
+from typing import Any, Generator
+from unittest.mock import patch
 
 import pysubs2
 import pytest
-from playwright.sync_api import Browser, Page, expect, sync_playwright
+import torch
+from playwright.sync_api import (
+    Browser,
+    BrowserContext,
+    Page,
+    expect,
+    sync_playwright,
+)
 
-from duosubs import SubtitleFormat
+from duosubs.webui.manager.model_manager import ModelPool
 from duosubs.webui.ui.layout import create_main_gr_blocks_ui
-from tests.webui.common_utils.utils import get_free_port, wait_for_server
+from tests.webui.common_utils.utils import MODEL_NAME, get_free_port
 
 SUB_PATH = Path(__file__).parent / "data"
 SUB_1 = SUB_PATH / "primary.srt"
@@ -29,32 +40,33 @@ MERGED_SUB_WITH_NEWLINES = SUB_PATH / "retain_newlines.ass"
 MERGED_SUB_WITHOUT_NEWLINES = SUB_PATH / "merged.ass"
 MERGED_SUB_WITH_SECONDARY_ABOVE = SUB_PATH / "secondary_above_primary.ass"
 MERGED_SUB_WITH_PRIMARY_ABOVE = SUB_PATH / "merged.ass"
-SUB_EXT_LIST: list[str] = [f.value for f in SubtitleFormat]
 
 # === Fixture: Reuse server session ===
-@pytest.fixture(scope="session", autouse=True)
-def gradio_server() -> Generator[str, None, None]:
+@pytest.fixture(scope="session")
+def gradio_server(cached_model: str) -> Generator[str, None, None]:
     """
-    Pytest fixture to start and yield a Gradio server URL for the test session.
+    Pytest fixture to start and yield a Gradio server URL for the test session (one 
+    server per pytest-xdist worker).
+
+    Args:
+        cached_model: The model name, already present in the Hugging Face cache.
 
     Yields:
         str: The base URL of the running Gradio server.
     """
-    port = get_free_port()
-    
-    try:
-        multiprocessing.set_start_method("spawn", force=True)
-    except RuntimeError:
-        pass
+    yield from serve_gradio_web_ui(stub_model=False)
 
-    proc = multiprocessing.Process(target=run_gradio_web_ui, args=(port,), daemon=True)
-    proc.start()
-    try:
-        wait_for_server(f"http://127.0.0.1:{port}/", timeout=30)
-        yield f"http://127.0.0.1:{port}"
-    finally:
-        proc.terminate()
-        proc.join()
+# === Fixture: Reuse stub model server session ===
+@pytest.fixture(scope="session")
+def stub_gradio_server() -> Generator[str, None, None]:
+    """
+    Pytest fixture to start and yield the URL of a Gradio server whose model pool 
+    returns a StubModel instead of loading a real SentenceTransformer.
+
+    Yields:
+        str: The base URL of the running Gradio server.
+    """
+    yield from serve_gradio_web_ui(stub_model=True)
 
 # === Fixture: Reuse browser session ===
 @pytest.fixture(scope="session")
@@ -70,27 +82,54 @@ def playwright_browser() -> Generator[Browser, None, None]:
         yield browser
         browser.close()
 
+# === Fixture: Reuse browser context ===
+@pytest.fixture(scope="session")
+def browser_context(
+    playwright_browser: Browser
+) -> Generator[BrowserContext, None, None]:
+    """
+    Pytest fixture to create and yield a Playwright browser context shared by all tests.
+
+    Args:
+        playwright_browser: The Playwright browser instance.
+
+    Yields:
+        BrowserContext: The Playwright browser context.
+    """
+    context = playwright_browser.new_context()
+    yield context
+    context.close()
+
 # === Fixture: New page per test ===
 @pytest.fixture()
 def page(
-    gradio_server: str,
-    playwright_browser: Browser
+    request: pytest.FixtureRequest,
+    browser_context: BrowserContext
 ) -> Generator[Page, None, None]:
     """
     Pytest fixture to create and yield a new Playwright page for each test.
 
+    Each page loads the UI afresh, so it starts with a new Gradio session and default 
+    component values; no state leaks between tests through the shared context. Tests 
+    marked with ``stub_model`` are served by the stub model server.
+
     Args:
-        gradio_server: The base URL of the running Gradio server.
-        playwright_browser: The Playwright browser instance.
+        request: The pytest request for the current test.
+        browser_context: The shared Playwright browser context.
 
     Yields:
         Page: The Playwright page instance for the test.
     """
-    context = playwright_browser.new_context()
-    page = context.new_page()
-    page.goto(gradio_server)
+    server_fixture = (
+        "stub_gradio_server"
+        if request.node.get_closest_marker("stub_model")
+        else "gradio_server"
+    )
+    server_url: str = request.getfixturevalue(server_fixture)
+    page = browser_context.new_page()
+    page.goto(server_url)
     yield page
-    context.close()
+    page.close()
 
 # ---------------------------------
 # Basic Merging Workflow Tests
@@ -109,11 +148,8 @@ def test_initial_button_states(page: Page) -> None:
     merge_button = page.get_by_role("button", name="Merge")
     cancel_button = page.get_by_role("button", name="Cancel")
 
-    merge_button.wait_for()
-    cancel_button.wait_for()
-
-    assert merge_button.is_enabled()
-    assert cancel_button.is_disabled()
+    expect(merge_button).to_be_enabled()
+    expect(cancel_button).to_be_disabled()
 
 def test_empty_subtitles(page: Page) -> None:
     """
@@ -267,6 +303,7 @@ def test_secondary_above_primary_options(
     perform_download(page, tmp_path / "output.zip")
     assert_merged_subs_content(tmp_path / "output.zip", expected_merged_subs)
 
+@pytest.mark.stub_model
 @pytest.mark.parametrize(
     "excluded_file_types, naming_list",
     [
@@ -307,39 +344,48 @@ def test_excluding_subs_file(
     perform_download(page, tmp_path / "output.zip")
     assert_merged_subs_naming(tmp_path / "output.zip", naming_list)
 
-def test_format_options(page: Page, tmp_path: Path) -> None:
+@pytest.mark.stub_model
+@pytest.mark.parametrize(
+    "formats",
+    [("ass", "srt", "vtt"), ("ssa", "ttml", "mpl2")],
+    ids=["ass-srt-vtt", "ssa-ttml-mpl2"]
+)
+def test_format_options(
+    page: Page,
+    tmp_path: Path,
+    formats: tuple[str, str, str]
+) -> None:
     """
     Test that changing subtitle format options affects output file naming.
 
     Args:
         page (Page): Playwright page instance.
         tmp_path (Path): Temporary path for output files.
+        formats (tuple[str, str, str]): Formats for the combined, primary and 
+            secondary subtitle files.
     """
-    random_format = []
-    for _ in range(3):
-        random_format.append(SUB_EXT_LIST[random.randint(0,len(SUB_EXT_LIST)-1)])
-
     page.get_by_role("tab", name="File Exports").click()
 
     page.get_by_role("listbox", name="Combined").click()
-    page.get_by_role("option", name=random_format[0]).nth(0).click()
+    page.get_by_role("option", name=formats[0]).nth(0).click()
 
     page.get_by_role("listbox", name="Primary").click()
-    page.get_by_role("option", name=random_format[1]).nth(0).click()
+    page.get_by_role("option", name=formats[1]).nth(0).click()
 
     page.get_by_role("listbox", name="Secondary").click()
-    page.get_by_role("option", name=random_format[2]).nth(0).click()
+    page.get_by_role("option", name=formats[2]).nth(0).click()
 
     naming_list = [
-        f"_combined.{random_format[0]}",
-        f"_primary.{random_format[1]}",
-        f"_secondary.{random_format[2]}"
+        f"_combined.{formats[0]}",
+        f"_primary.{formats[1]}",
+        f"_secondary.{formats[2]}"
     ]
 
     perform_merging(page, SUB_1, SUB_2)
     perform_download(page, tmp_path / "output.zip")
     assert_merged_subs_naming(tmp_path / "output.zip", naming_list)
 
+@pytest.mark.stub_model
 def test_omit_all_subs_files(page: Page) -> None:
     """
     Test that omitting all subtitle files triggers a warning and disables merging and 
@@ -350,23 +396,22 @@ def test_omit_all_subs_files(page: Page) -> None:
     """
     page.get_by_role("tab", name="File Exports").click()
     page.get_by_role("checkbox", name="Combined").wait_for()
-    checkboxes = page.get_by_role("checkbox")
-    count = checkboxes.count()
-
-    for i in range(count):
-        checkboxes.nth(i).check()
+    # Check all boxes in a single browser round trip; click() fires Gradio's handlers
+    page.get_by_role("checkbox").evaluate_all(
+        "boxes => boxes.forEach(box => { if (!box.checked) box.click(); })"
+    )
 
-    expect(
-        page.locator("div.toast-body.warning").filter(has_text="Nothing to merge")
-    ).to_be_visible(timeout=60000)
+    nothing_to_merge_toast = page.locator("div.toast-body.warning").filter(
+        has_text="Nothing to merge"
+    )
+    expect(nothing_to_merge_toast).to_be_visible(timeout=60000)
 
-    time.sleep(10)
+    # Wait for the toast to auto-dismiss so the next one is a fresh warning
+    expect(nothing_to_merge_toast).to_have_count(0, timeout=15000)
 
     perform_merging(page, SUB_1, SUB_2)
 
-    expect(
-        page.locator("div.toast-body.warning").filter(has_text="Nothing to merge")
-    ).to_be_visible(timeout=60000)
+    expect(nothing_to_merge_toast).to_be_visible(timeout=60000)
 
     section = page.get_by_text(
         "Processed Subtitles (in zip)",
@@ -380,16 +425,80 @@ def test_omit_all_subs_files(page: Page) -> None:
 # Helper functions
 # ----------------------------
 
-def run_gradio_web_ui(port: int) -> None:
+class StubModel:
+    """
+    Stub sentence embedding model for UI tests that do not check alignment quality.
+    """
+    def encode(self, texts: str | list[str], **_kwargs: Any) -> torch.Tensor:
+        """
+        Return identical non-zero embeddings for all input texts.
+
+        Args:
+            texts (str | list[str]): Input text or texts to encode.
+            **_kwargs: Additional keyword arguments (ignored).
+
+        Returns:
+            torch.Tensor: Tensor of ones shaped like sentence embeddings; 1-D for a 
+            single text, as SentenceTransformer.encode returns.
+        """
+        if isinstance(texts, str):
+            return torch.ones(384)
+        return torch.ones(len(texts), 384)
+
+def serve_gradio_web_ui(stub_model: bool) -> Generator[str, None, None]:
+    """
+    Helper to run the Gradio web UI server in a spawned process on a free port and 
+    yield its URL until the caller is done with it.
+
+    Args:
+        stub_model (bool): Whether the server should use StubModel for merging.
+
+    Yields:
+        str: The base URL of the running Gradio server.
+    """
+    port = get_free_port()
+
+    spawn_context = multiprocessing.get_context("spawn")
+    ready_event = spawn_context.Event()
+    proc = spawn_context.Process(
+        target=run_gradio_web_ui,
+        args=(port, ready_event, stub_model),
+        daemon=True
+    )
+    proc.start()
+    try:
+        if not ready_event.wait(timeout=30):
+            raise RuntimeError(f"Server on port {port} didn't start in 30 seconds")
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        proc.terminate()
+        proc.join()
+
+def run_gradio_web_ui(
+    port: int,
+    ready_event: Event,
+    stub_model: bool = False
+) -> None:
     """
-    Helper to start the Gradio web UI server on a given port.
+    Helper to start the Gradio web UI server on a given port, signal readiness once it 
+    is serving, and keep it running until the process is terminated.
 
     Args:
         port (int): Port to run the server on.
+        ready_event (Event): Event set once the server accepts requests.
+        stub_model (bool): If True, the model pool hands out StubModel instances 
+            instead of loading the requested SentenceTransformer.
     """
-    duosubs_server = create_main_gr_blocks_ui()
-    duosubs_server.queue(default_concurrency_limit=None)
-    duosubs_server.launch(server_port=port)
+    model_patch = (
+        patch.object(ModelPool, "load_model", return_value=StubModel())
+        if stub_model else nullcontext()
+    )
+    with model_patch:
+        duosubs_server = create_main_gr_blocks_ui()
+        duosubs_server.queue(default_concurrency_limit=None)
+        duosubs_server.launch(server_port=port, prevent_thread_lock=True)
+        ready_event.set()
+        duosubs_server.block_thread()
 
 def perform_merging(page: Page, sub_1: Path, sub_2: Path) -> None:
     """
@@ -404,7 +513,7 @@ def perform_merging(page: Page, sub_1: Path, sub_2: Path) -> None:
     page.get_by_role("tab", name="Model & Device").click()
     page.get_by_label(
         "Sentence Transformer Model"
-    ).fill("sentence-transformers/all-MiniLM-L6-v2")
+    ).fill(MODEL_NAME)
 
     page.locator(
         "div:has-text('Primary Subtitle File') input[type='file']"
@@ -444,9 +553,9 @@ def assert_merged_subs_naming(output_zip_path: Path, naming_list: list[str]) ->
     """
     with zipfile.ZipFile(output_zip_path, 'r') as zip_ref:
         file_list = zip_ref.namelist()
-        assert len(file_list) == len(naming_list)
-        for naming in naming_list:
-            assert any(f.endswith(naming) for f in file_list)
+    assert len(file_list) == len(naming_list)
+    file_endings = {f[f.rfind("_"):] for f in file_list}
+    assert set(naming_list) <= file_endings
 
 def assert_merged_subs_content(output_zip_path: Path, expected_subs_path: Path) -> None:
     """
@@ -457,18 +566,30 @@ def assert_merged_subs_content(output_zip_path: Path, expected_subs_path: Path)
         expected_subs_path (Path): Path to the expected subtitle file.
     """
     with zipfile.ZipFile(output_zip_path, 'r') as zip_ref:
-        file_list = zip_ref.namelist()
-        assert any(f.endswith("_combined.ass") for f in file_list)
-        
-        combined_file_name = ""
-        for name in zip_ref.namelist():
-            if fnmatch.fnmatch(name, "*_combined.ass"):
-                combined_file_name = name
+        combined_file_name = next(
+            (f for f in zip_ref.namelist() if f.endswith("_combined.ass")),
+            None
+        )
+        assert combined_file_name is not None
 
         with zip_ref.open(combined_file_name) as f:
             merged_subs =  pysubs2.SSAFile.from_string(f.read().decode("utf-8"))
-            expected_subs = pysubs2.load(str(expected_subs_path))
+            expected_subs = load_expected_subs(str(expected_subs_path))
             for output, expected in zip(merged_subs, expected_subs, strict=False):
                 assert output.start == expected.start
                 assert output.end == expected.end
                 assert output.text == expected.text
+
+@lru_cache(maxsize=None)
+def load_expected_subs(expected_subs_path: str) -> pysubs2.SSAFile:
+    """
+    Load an expected subtitle file once and reuse it across test runs; callers must 
+    only read from the returned SSAFile.
+
+    Args:
+        expected_subs_path (str): Path to the expected subtitle file.
+
+    Returns:
+        pysubs2.SSAFile: The parsed expected subtitle file.
+    """
+    return pysubs2.load(expected_subs_path)